@@ -0,0 +1,92 @@
+import hashlib
+import os
+import pickle
+import pickletools
+import tempfile
+import ply.yacc as yacc
+
+# ==================================================================
+# Cache das tabelas LALR do PLY (compartilhado pelas fases 1 e 2)
+# ==================================================================
+# A construção das tabelas LALR com yacc.yacc() é o custo dominante
+# na inicialização. O LRParser construído é serializado com pickle no
+# __pycache__ ao lado do módulo da gramática, com nome derivado de um
+# hash da gramática; nas execuções seguintes ele é apenas carregado e
+# as funções p_* são religadas ao módulo. Como o pickle já é o cache,
+# o PLY não grava parsetab.py nem parser.out.
+# ==================================================================
+
+def _liga_callables(parser, modulo):
+    # Religa as ações semânticas (p_*) e o p_error ao módulo atual
+    for prod in parser.productions:
+        prod.callable = getattr(modulo, prod.func) if prod.func else None
+    parser.errorfunc = getattr(modulo, 'p_error', None)
+    return parser
+
+
+def _salva_parser(parser, caminho):
+    # Funções não são serializadas: remove as referências antes do pickle
+    for prod in parser.productions:
+        prod.callable = None
+    parser.errorfunc = None
+    dados = pickletools.optimize(pickle.dumps(parser, protocol=5))
+
+    # Escrita atômica: arquivo temporário no mesmo diretório + os.replace
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        fd, caminho_tmp = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+    except OSError:
+        # Sem permissão de escrita: segue sem cache
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(dados)
+        os.replace(caminho_tmp, caminho)
+    except OSError:
+        # Falha ao gravar ou renomear: remove o temporário e segue sem cache
+        try:
+            os.unlink(caminho_tmp)
+        except OSError:
+            pass
+
+
+def _assinatura_gramatica(modulo):
+    # Só o que define as tabelas LALR: tokens, precedence, start e o
+    # nome/docstring de cada p_*, na ordem do arquivo (a mesma usada pelo
+    # PLY para numerar as produções). Mudanças nas ações semânticas, no
+    # lexer ou em comentários não invalidam o cache
+    funcoes = sorted(
+        (f for nome, f in vars(modulo).items()
+         if nome.startswith('p_') and nome != 'p_error' and callable(f)),
+        key=lambda f: f.__code__.co_firstlineno,
+    )
+    partes = [
+        yacc.__version__,
+        repr(getattr(modulo, 'tokens', None)),
+        repr(getattr(modulo, 'precedence', None)),
+        repr(getattr(modulo, 'start', None)),
+    ]
+    partes += [f'{f.__name__}: {f.__doc__}' for f in funcoes]
+    return hashlib.sha1('\n'.join(partes).encode('utf-8')).hexdigest()[:12]
+
+
+def carrega_parser(modulo, **opcoes_yacc):
+    """Retorna o parser do módulo, usando o cache em disco quando possível."""
+    chave = _assinatura_gramatica(modulo)
+    diretorio, arquivo = os.path.split(os.path.abspath(modulo.__file__))
+    nome = os.path.splitext(arquivo)[0]
+    caminho = os.path.join(diretorio, '__pycache__', f'{nome}.parsetab-{chave}.pickle')
+
+    try:
+        with open(caminho, 'rb') as f:
+            parser = pickle.load(f)
+    except Exception:
+        parser = None
+
+    if parser is None:
+        opcoes_yacc.setdefault('write_tables', False)
+        opcoes_yacc.setdefault('debug', False)
+        parser = yacc.yacc(module=modulo, **opcoes_yacc)
+        _salva_parser(parser, caminho)
+
+    return _liga_callables(parser, modulo)
@@ -1,6 +1,13 @@
+import io
+import itertools
+import os
 import sys
-import ply.lex as lex
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import cache
 import ply.yacc as yacc
+from cache_parser import carrega_parser
+from lexer_regex import LexerRegex
 
 # ==================================================================
 # Tokens / Palavras Reservadas (Adaptado para PascalLite Simplificado)
@@ -23,6 +30,17 @@ reserved = {
     'write': 'WRITE'
 }
 
+# Todas as grafias (maiúsculas/minúsculas) de cada palavra reservada:
+# o lexer consulta o identificador como está, sem criar a string de
+# valor.lower() a cada token
+RESERVED_ANYCASE = {
+    sys.intern(''.join(letras)): tipo
+    for palavra, tipo in reserved.items()
+    for letras in itertools.product(*((c, c.upper()) for c in palavra))
+}
+# Identificadores mais longos que isso não podem ser palavra reservada
+MAIOR_RESERVADA = max(map(len, reserved))
+
 tokens = [
     'IDENTIFICADOR', 'NUMERO',
     'ATRIBUICAO', 'MAIOR', 'MENOR', 'IGUAL', 'DIFERENTE', 'MAIORIGUAL', 'MENORIGUAL',
@@ -31,79 +49,85 @@ tokens = [
     'ABREPAREN', 'FECHAPAREN'
 ] + list(reserved.values())
 
-# Regexs para tokens simples
-t_ATRIBUICAO = r':='
-t_MAIORIGUAL = r'>='
-t_MENORIGUAL = r'<='
-t_DIFERENTE = r'<>'
-t_MAIOR = r'>'
-t_MENOR = r'<'
-t_IGUAL = r'='
-t_SOMA = r'\+'
-t_SUB = r'-'
-t_MUL = r'\*'
-t_DIVISAO = r'/'
-t_DOISPONTOS = r':'
-t_PONTOEVIRGULA = r';'
-t_VIRGULA = r','
-t_PONTO = r'\.'
-t_ABREPAREN = r'\('
-t_FECHAPAREN = r'\)'
-
-# Identificador / número
-def t_IDENTIFICADOR(t):
-    r'[A-Za-z_][A-Za-z0-9_]*'
-    t.type = reserved.get(t.value.lower(), 'IDENTIFICADOR')
-    return t
-
-def t_NUMERO(t):
-    r'[0-9]+'
-    t.value = int(t.value)
-    return t
-
-t_ignore = ' \t'
-
-# Comentários e newline
-def t_comment_multiline(t):
-    r'\(\*[\s\S]*?\*\)'
-    t.lexer.lineno += t.value.count('\n')
-
-def t_comment_braces(t):
-    r'\{[^}]*\}'
-    t.lexer.lineno += t.value.count('\n')
-
-def t_comment_line(t):
-    r'//.*'
-    pass
-
-def t_newline(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
-
-def t_error(t):
-    print(f"Erro Léxico: caractere ilegal '{t.value[0]}' na linha {t.lexer.lineno}")
-    t.lexer.skip(1)
+# ==================================================================
+# Analisador léxico
+# ==================================================================
+# As regras (nome, regex) formam o regex mestre do LexerRegex (ver
+# lexer_regex.py). Comentários vêm antes de ABREPAREN/DIVISAO e
+# operadores de dois caracteres antes dos de um. ERRO casa qualquer
+# caractere ilegal.
+REGRAS_LEXICAS = [
+    # Quebra de linha junto com a indentação que a segue
+    ('NL',            r'\n[ \t\n]*'),
+    # Comentário de bloco na forma "desenrolada": avança por trechos sem
+    # '*' em vez de testar o fechamento a cada caractere ([\s\S]*?)
+    ('COMMENT',       r'\(\*[^*]*\*+(?:[^)*][^*]*\*+)*\)|\{[^}]*\}|//[^\n]*'),
+    ('IDENTIFICADOR', r'[A-Za-z_][A-Za-z0-9_]*'),
+    ('NUMERO',        r'[0-9]+'),
+    ('ATRIBUICAO',    r':='),
+    ('MAIORIGUAL',    r'>='),
+    ('MENORIGUAL',    r'<='),
+    ('DIFERENTE',     r'<>'),
+    ('MAIOR',         r'>'),
+    ('MENOR',         r'<'),
+    ('IGUAL',         r'='),
+    ('SOMA',          r'\+'),
+    ('SUB',           r'-'),
+    ('MUL',           r'\*'),
+    ('DIVISAO',       r'/'),
+    ('DOISPONTOS',    r':'),
+    ('PONTOEVIRGULA', r';'),
+    ('VIRGULA',       r','),
+    ('PONTO',         r'\.'),
+    ('ABREPAREN',     r'\('),
+    ('FECHAPAREN',    r'\)'),
+    ('ERRO',          r'[^ \t\n]'),
+]
+def classifica_identificador(valor, lineno):
+    # Nomes mais longos que a maior palavra reservada nem consultam o
+    # dicionário
+    if len(valor) <= MAIOR_RESERVADA:
+        return RESERVED_ANYCASE.get(valor, 'IDENTIFICADOR')
+    return 'IDENTIFICADOR'
+
+def cria_lexer():
+    return LexerRegex(REGRAS_LEXICAS, 'IDENTIFICADOR', 'NUMERO', classifica_identificador)
 
 # ==================================================================
 # Tabela de Símbolos e Utilitários Semânticos
 # ==================================================================
+# Tabela nome -> endereço, consultada a cada uso de variável (o tipo
+# não é guardado: PascalLite simplificado só tem variáveis integer)
 tabela_simbolos = {}
-proximo_endereco = 0
+# Gerador dos endereços das variáveis (0, 1, 2, ...)
+proximo_endereco = itertools.count()
 rotulo_contador = 0
 
-def insere_tabela_simbolos(nome, tipo):
-    global proximo_endereco
-    if nome in tabela_simbolos:
+def insere_tabela_simbolos(nome):
+    endereco = next(proximo_endereco)
+    # setdefault insere e detecta duplicata numa única operação no dicionário
+    if tabela_simbolos.setdefault(nome, endereco) != endereco:
         # Erro semântico: Variável já declarada
         raise SystemExit(f"Erro semântico: variável '{nome}' já declarada.")
-    tabela_simbolos[nome] = {"tipo": tipo, "endereco": proximo_endereco}
-    proximo_endereco += 1
 
 def busca_tabela_simbolos(nome):
-    if nome not in tabela_simbolos:
+    try:
+        return tabela_simbolos[nome]
+    except KeyError:
         # Erro semântico: Variável não declarada
-        raise SystemExit(f"Erro semântico: variável '{nome}' não declarada.")
-    return tabela_simbolos[nome]["endereco"]
+        raise SystemExit(f"Erro semântico: variável '{nome}' não declarada.") from None
+
+# Buffer de saída MEPA: as instruções são acumuladas e escritas de
+# uma só vez (um único write em vez de um print por instrução)
+_emit_buf = []
+
+def emit(instrucao):
+    _emit_buf.append(instrucao)
+
+def descarrega_mepa():
+    if _emit_buf:
+        sys.stdout.write("\n".join(_emit_buf) + "\n")
+        _emit_buf.clear()
 
 def proximo_rotulo():
     global rotulo_contador
@@ -111,10 +135,165 @@ def proximo_rotulo():
     return f"L{rotulo_contador}"
 
 # ==================================================================
-# Precedência e Gramática (com Geração MEPA)
+# Árvore Sintática e Geração de Código MEPA
+# ==================================================================
+# As ações da gramática apenas constroem a árvore; o código MEPA é
+# gerado numa segunda passada sobre a lista de comandos, com pilhas
+# explícitas em vez de recursão (expressões e blocos podem ter milhares
+# de níveis). Comandos também são classes com __slots__ (sem __dict__ e
+# sem a string de tipo que as tuplas carregavam); __match_args__ permite
+# desestruturá-los com match/case em gera_comando.
+
+class Constante:
+    __slots__ = ('valor',)
+    def __init__(self, valor):
+        self.valor = valor
+
+class Variavel:
+    __slots__ = ('endereco',)
+    def __init__(self, endereco):
+        self.endereco = endereco
+
+class Binaria:
+    __slots__ = ('op', 'esq', 'dir')
+    def __init__(self, op, esq, dir):
+        self.op = op
+        self.esq = esq
+        self.dir = dir
+
+class Atribuicao:
+    __slots__ = ('endereco', 'expressao')
+    __match_args__ = __slots__
+    def __init__(self, endereco, expressao):
+        self.endereco = endereco
+        self.expressao = expressao
+
+class Leitura:
+    __slots__ = ('endereco',)
+    __match_args__ = __slots__
+    def __init__(self, endereco):
+        self.endereco = endereco
+
+class Escrita:
+    __slots__ = ('endereco',)
+    __match_args__ = __slots__
+    def __init__(self, endereco):
+        self.endereco = endereco
+
+class Se:
+    __slots__ = ('cond', 'entao', 'senao')
+    __match_args__ = __slots__
+    def __init__(self, cond, entao, senao):
+        self.cond = cond
+        self.entao = entao
+        self.senao = senao
+
+class Enquanto:
+    __slots__ = ('cond', 'corpo')
+    __match_args__ = __slots__
+    def __init__(self, cond, corpo):
+        self.cond = cond
+        self.corpo = corpo
+
+class Bloco:
+    __slots__ = ('comandos',)
+    __match_args__ = __slots__
+    def __init__(self, comandos):
+        self.comandos = comandos
+
+# Instruções ARMZ/CRVL já formatadas, indexadas pelo endereço da variável
+# (montadas em p_declaracoes, quando o total de variáveis é conhecido)
+_ARMZ = ()
+_CRVL = ()
+
+# Operador -> instrução MEPA
+_OP_MEPA = {
+    # relacionais
+    '<': "CMME", '<=': "CMEG", '>': "CMMA", '>=': "CMAG", '=': "CMIG", '<>': "CMDG",
+    # aditivos
+    '+': "SOMA", '-': "SUBT",
+    # multiplicativos
+    '*': "MULT", '/': "DIVI",
+}
+
+def gera_expressao(no):
+    # Emite as instruções que empilham o valor da expressão, em pós-ordem.
+    # Cada item da pilha é um nó ainda não visitado ou a instrução (str)
+    # de um operador cujos operandos já foram emitidos.
+    emite = _emit_buf.append
+    pilha = [no]
+    while pilha:
+        no = pilha.pop()
+        if type(no) is str:
+            emite(no)
+        elif type(no) is Binaria:
+            pilha.append(_OP_MEPA[no.op])
+            pilha.append(no.dir)
+            pilha.append(no.esq)
+        elif type(no) is Variavel:
+            emite(_CRVL[no.endereco])
+        else:
+            emite(f"CRCT {no.valor}")
+
+def gera_comando(cmd):
+    # A pilha guarda comandos pendentes e rótulos/saltos (str) a emitir
+    # depois deles. Os rótulos de um comando são reservados antes dos
+    # comandos internos, na ordem em que aparecem no programa.
+    pilha = [cmd]
+    while pilha:
+        cmd = pilha.pop()
+        match cmd:
+            case str():
+                emit(cmd)
+            case Atribuicao(endereco, expressao):
+                # Empilha o valor da expressão e armazena na variável
+                gera_expressao(expressao)
+                emit(_ARMZ[endereco])
+            case Leitura(endereco):
+                emit("LEIT")
+                emit(_ARMZ[endereco])
+            case Escrita(endereco):
+                emit(_CRVL[endereco])
+                emit("IMPR")
+            case Se(cond, entao, None):
+                # IF sem ELSE
+                gera_expressao(cond)
+                L1 = proximo_rotulo()
+                emit(f"DSVF {L1}")          # salta o bloco se a condição for falsa
+                pilha.append(f"{L1}:")      # fim do bloco IF
+                pilha.append(entao)
+            case Se(cond, entao, senao):
+                # IF com ELSE
+                gera_expressao(cond)
+                L1 = proximo_rotulo()
+                L2 = proximo_rotulo()
+                emit(f"DSVF {L1}")          # salta para o bloco falso
+                pilha.append(f"{L2}:")      # fim do IF
+                pilha.append(senao)
+                pilha.append(f"{L1}:")      # início do bloco falso
+                pilha.append(f"DSVS {L2}")  # pula o bloco falso
+                pilha.append(entao)
+            case Enquanto(cond, corpo):
+                L1 = proximo_rotulo()  # início do loop
+                L2 = proximo_rotulo()  # saída do loop
+                emit(f"{L1}:")
+                gera_expressao(cond)
+                emit(f"DSVF {L2}")
+                pilha.append(f"{L2}:")
+                pilha.append(f"DSVS {L1}")      # volta para início do while
+                pilha.append(corpo)
+            case Bloco(comandos):
+                # bloco (comando composto), na ordem original
+                pilha.extend(reversed(comandos))
+
+# ==================================================================
+# Precedência e Gramática
 # ==================================================================
 
+# Relacionais têm a menor prioridade e não se encadeiam (a < b < c é
+# erro sintático, como na gramática em camadas)
 precedence = (
+    ('nonassoc', 'MENOR', 'MENORIGUAL', 'MAIOR', 'MAIORIGUAL', 'IGUAL', 'DIFERENTE'),
     ('left', 'SOMA', 'SUB'),
     ('left', 'MUL', 'DIVISAO')
 )
@@ -122,18 +301,27 @@ precedence = (
 def p_programa(p):
     'programa : PROGRAM IDENTIFICADOR PONTOEVIRGULA declaracoes bloco_final'
     # Geração do código de inicialização e finalização MEPA
-    print("INPP")
+    emit("INPP")
     # Usa o tamanho da tabela para AMEM
-    print(f"AMEM {len(tabela_simbolos)}")
-    # O código do bloco foi gerado antes de 'PONTO' ser consumido
-    print("PARA")
+    emit(f"AMEM {len(tabela_simbolos)}")
+    for cmd in p[5]:
+        gera_comando(cmd)
+    emit("PARA")
 
 def p_declaracoes(p):
     'declaracoes : VAR lista_declaracoes'
-    pass # As ações semânticas já foram executadas em p_declaracao
-
+    # As ações semânticas já foram executadas em p_declaracao; com o
+    # número de variáveis conhecido, pré-formata ARMZ/CRVL por endereço
+    global _ARMZ, _CRVL
+    n = len(tabela_simbolos)
+    _ARMZ = tuple([f"ARMZ {i}" for i in range(n)])
+    _CRVL = tuple([f"CRVL {i}" for i in range(n)])
+
+# Listas em recursão à esquerda: a pilha do parser não cresce com o
+# tamanho da lista e cada elemento é anexado com append, sem a cópia
+# de [p[1]] + p[3] a cada nível
 def p_lista_declaracoes(p):
-    '''lista_declaracoes : declaracao PONTOEVIRGULA lista_declaracoes
+    '''lista_declaracoes : lista_declaracoes declaracao PONTOEVIRGULA
                          | declaracao PONTOEVIRGULA'''
     pass
 
@@ -141,31 +329,38 @@ def p_declaracao(p):
     'declaracao : lista_ident DOISPONTOS INTEGER'
     # Insere cada identificador na tabela de símbolos
     for ident in p[1]:
-        insere_tabela_simbolos(ident, 'integer')
+        insere_tabela_simbolos(ident)
 
 def p_lista_ident(p):
-    '''lista_ident : IDENTIFICADOR
-                   | IDENTIFICADOR VIRGULA lista_ident'''
+    '''lista_ident : lista_ident VIRGULA IDENTIFICADOR
+                   | IDENTIFICADOR'''
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = [p[1]] + p[3]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 # Bloco usado internamente (comando composto): NÃO consome PONTOEVIRGULA
+# depois do END. O ';' opcional antes do END fica aqui, e não na lista
 def p_bloco(p):
-    'bloco : BEGIN lista_comandos END' 
-    p[0] = p[2]
+    '''bloco : BEGIN lista_comandos END
+             | BEGIN lista_comandos PONTOEVIRGULA END'''
+    p[0] = Bloco(p[2])
 
 # Bloco final do programa: consome o PONTO final
 def p_bloco_final(p):
-    'bloco_final : BEGIN lista_comandos END PONTO'
-    pass # As ações semânticas foram geradas em lista_comandos
+    '''bloco_final : BEGIN lista_comandos END PONTO
+                   | BEGIN lista_comandos PONTOEVIRGULA END PONTO'''
+    p[0] = p[2]
 
 def p_lista_comandos(p):
-    '''lista_comandos : comando PONTOEVIRGULA lista_comandos
-                      | comando
-                      | comando PONTOEVIRGULA''' # Permite ';' no último comando antes do END
-    pass
+    '''lista_comandos : lista_comandos PONTOEVIRGULA comando
+                      | comando'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_comando(p):
     '''comando : atribuicao
@@ -174,124 +369,61 @@ def p_comando(p):
                | comando_read
                | comando_write
                | bloco'''
-    pass
+    p[0] = p[1]
 
 def p_atribuicao(p):
     'atribuicao : IDENTIFICADOR ATRIBUICAO expressao'
     endereco = busca_tabela_simbolos(p[1]) # Verifica se o identificador foi declarado
-    # Expressão já gerou código (empilhou o valor)
-    print(f"ARMZ {endereco}")
+    p[0] = Atribuicao(endereco, p[3])
 
 def p_comando_read(p):
     'comando_read : READ ABREPAREN IDENTIFICADOR FECHAPAREN'
     end = busca_tabela_simbolos(p[3]) # Verifica se o identificador foi declarado
-    print("LEIT")
-    print(f"ARMZ {end}")
+    p[0] = Leitura(end)
 
 def p_comando_write(p):
     'comando_write : WRITE ABREPAREN IDENTIFICADOR FECHAPAREN'
     end = busca_tabela_simbolos(p[3]) # Verifica se o identificador foi declarado
-    print(f"CRVL {end}")
-    print("IMPR")
+    p[0] = Escrita(end)
 
 def p_comando_if(p):
     '''comando_if : IF expressao THEN comando
                   | IF expressao THEN comando ELSE comando'''
-    
-    if len(p) == 5:
-        # IF sem ELSE
-        L1 = proximo_rotulo()
-        # Gera o salto condicional
-        print(f"DSVF {L1}")
-        # Código do comando verdadeiro já gerado ao chamar p[4]
-        print(f"{L1}:")  # Rótulo marca fim do bloco IF
-    else:
-        # IF com ELSE
-        L1 = proximo_rotulo()
-        L2 = proximo_rotulo()
-        # Salta para o bloco falso se condição for falsa
-        print(f"DSVF {L1}")
-        # Código do comando verdadeiro p[4] já gerado
-        print(f"DSVS {L2}")
-        # Rótulo do início do bloco falso
-        print(f"{L1}:")
-        # Código do comando falso p[6] já gerado
-        print(f"{L2}:")  # Fim do IF
+    p[0] = Se(p[2], p[4], p[6] if len(p) == 7 else None)
 
 def p_comando_while(p):
     'comando_while : WHILE expressao DO comando'
-    
-    L1 = proximo_rotulo()  # início do loop
-    L2 = proximo_rotulo()  # saída do loop
-    
-    print(f"{L1}:")       # marca o início do while
-    # A condição já gerou CRVL/CRCT + comparação
-    print(f"DSVF {L2}")
-    # Corpo do loop (p[4]) já gerou seu código MEPA
-    print(f"DSVS {L1}")   # volta para início do while
-    print(f"{L2}:")       # marca saída do loop
-
-# expressao -> chama expressao_relacional
-def p_expressao(p):
-    'expressao : expressao_relacional'
-    pass
-
-def p_expressao_relacional(p):
-    '''expressao_relacional : expressao_simples
-                            | expressao_simples MENOR expressao_simples
-                            | expressao_simples MENORIGUAL expressao_simples
-                            | expressao_simples MAIOR expressao_simples
-                            | expressao_simples MAIORIGUAL expressao_simples
-                            | expressao_simples IGUAL expressao_simples
-                            | expressao_simples DIFERENTE expressao_simples'''
-    if len(p) == 4:
-        # Comparações imprimem a instrução MEPA correspondente
-        if p[2] == '<':
-            print("CMME")
-        elif p[2] == '<=':
-            print("CMEG")
-        elif p[2] == '>':
-            print("CMMA")
-        elif p[2] == '>=':
-            print("CMAG")
-        elif p[2] == '=':
-            print("CMIG")
-        elif p[2] == '<>':
-            print("CMDG")
-
-def p_expressao_simples(p):
-    '''expressao_simples : termo
-                         | expressao_simples SOMA termo
-                         | expressao_simples SUB termo'''
-    if len(p) == 4:
-        if p[2] == '+':
-            print("SOMA")
-        else:
-            print("SUBT")
-
-def p_termo(p):
-    '''termo : fator
-             | termo MUL fator
-             | termo DIVISAO fator'''
-    if len(p) == 4:
-        if p[2] == '*':
-            print("MULT")
-        else:
-            print("DIVI")
-
-def p_fator(p):
-    '''fator : IDENTIFICADOR
-             | NUMERO
-             | ABREPAREN expressao FECHAPAREN'''
-    if len(p) == 2:
-        if isinstance(p[1], int):
-            print(f"CRCT {p[1]}") # Constante (número)
-        else:
-            end = busca_tabela_simbolos(p[1]) # Variável (identificador)
-            print(f"CRVL {end}")
-    else:
-        # (expressao) - a expressão já gerou o código de empilhamento
-        pass
+    p[0] = Enquanto(p[2], p[4])
+
+# Expressões numa única regra: a prioridade e a associatividade dos
+# operadores vêm da tabela precedence, e não de uma cadeia de não
+# terminais (expressao -> relacional -> simples -> termo -> fator).
+# Cada operando deixa de passar por quatro reduções unitárias.
+def p_expressao_binaria(p):
+    '''expressao : expressao MENOR expressao
+                 | expressao MENORIGUAL expressao
+                 | expressao MAIOR expressao
+                 | expressao MAIORIGUAL expressao
+                 | expressao IGUAL expressao
+                 | expressao DIFERENTE expressao
+                 | expressao SOMA expressao
+                 | expressao SUB expressao
+                 | expressao MUL expressao
+                 | expressao DIVISAO expressao'''
+    p[0] = Binaria(p[2], p[1], p[3])
+
+def p_expressao_numero(p):
+    'expressao : NUMERO'
+    p[0] = Constante(p[1]) # Constante (número)
+
+def p_expressao_identificador(p):
+    'expressao : IDENTIFICADOR'
+    end = busca_tabela_simbolos(p[1]) # Variável (identificador)
+    p[0] = Variavel(end)
+
+def p_expressao_grupo(p):
+    'expressao : ABREPAREN expressao FECHAPAREN'
+    p[0] = p[2]
 
 def p_error(p):
     if p:
@@ -304,14 +436,57 @@ def p_error(p):
 # -------------------------
 # Construção do lexer e parser
 # -------------------------
-lexer = lex.lex()
-# Ignora avisos de conflitos S/R que não impedem a análise
-parser = yacc.yacc(errorlog=yacc.NullLogger())
+@cache
+def obtem_parser():
+    # Construídos na primeira compilação, e só uma vez: importar o
+    # módulo não carrega as tabelas LALR.
+    # Ignora avisos de conflitos S/R que não impedem a análise
+    return cria_lexer(), carrega_parser(sys.modules[__name__], errorlog=yacc.NullLogger())
+
+def reinicia_estado():
+    global proximo_endereco, rotulo_contador
+    tabela_simbolos.clear()
+    proximo_endereco = itertools.count()
+    rotulo_contador = 0
+
+def compila(codigo):
+    # Analisa um programa PascalLite e escreve o código MEPA gerado.
+    # O estado é reiniciado a cada chamada, então vários programas podem
+    # ser compilados no mesmo processo.
+    reinicia_estado()
+    lexer, parser = obtem_parser()
+    lexer.lineno = 1
+    try:
+        parser.parse(codigo, lexer=lexer)
+    finally:
+        descarrega_mepa()
+
+def compila_para_texto(codigo):
+    # Compila um programa e devolve (saída, falhou) em vez de escrever no
+    # stdout: a saída de cada programa fica inteira, mesmo quando vários
+    # são compilados em paralelo
+    saida = io.StringIO()
+    falhou = False
+    with redirect_stdout(saida):
+        print("--- Saída MEPA Gerada ---")
+        try:
+            compila(codigo)
+            print("--- Análise Concluída com Sucesso ---")
+        except SystemExit as e:
+            print(f"\nERRO: {e}")
+            falhou = True
+        except Exception as e:
+            # Falha inesperada (não é um diagnóstico do compilador): vira
+            # o erro deste programa, sem derrubar os demais do pool
+            print(f"\nERRO interno: {type(e).__name__}: {e}")
+            falhou = True
+    return saida.getvalue(), falhou
 
 # -------------------------
 # Programa de teste
 # -------------------------
-programa_teste = """
+if __name__ == '__main__':
+    programa_teste = """
 program exemplo1;
 var fat, num, cont: integer;
 begin
@@ -327,16 +502,46 @@ begin
 end.
 """
 
-if __name__ == '__main__':
-    # Reinicia o estado para garantir a saída correta
-    tabela_simbolos.clear()
-    proximo_endereco = 0
-    rotulo_contador = 0
+    # Sem argumentos compila o programa de teste; caso contrário compila
+    # cada arquivo indicado ("-" lê o programa da entrada padrão). Um
+    # arquivo que não pode ser lido já vira o resultado (com erro) daquele
+    # programa, sem impedir a compilação dos demais; os outros ficam como
+    # None até serem compilados
+    codigos = []
+    resultados = []
+    for caminho in sys.argv[1:] or [None]:
+        if caminho is None:
+            codigo = programa_teste
+        elif caminho == '-':
+            codigo = sys.stdin.read()
+        else:
+            try:
+                with open(caminho, encoding='utf-8') as f:
+                    codigo = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                # strerror/reason: o motivo, sem repetir o caminho
+                motivo = e.strerror if isinstance(e, OSError) else e.reason
+                resultados.append((f"--- Saída MEPA Gerada ---\n\nERRO: não foi possível ler '{caminho}': {motivo}\n", True))
+                continue
+        codigos.append(codigo)
+        resultados.append(None)
+
+    if len(codigos) > 1:
+        # Os programas são independentes: cada um é compilado num processo
+        # (o GIL impede ganho com threads), sem abrir mais processos do que
+        # programas, e as saídas são escritas na ordem dos argumentos
+        with ProcessPoolExecutor(max_workers=min(len(codigos), os.cpu_count() or 1)) as executor:
+            compilados = list(executor.map(compila_para_texto, codigos))
+    else:
+        compilados = [compila_para_texto(codigo) for codigo in codigos]
 
-    print("--- Saída MEPA Gerada ---")
-    try:
-        parser.parse(programa_teste, lexer=lexer)
-        print("--- Análise Concluída com Sucesso ---")
-    except SystemExit as e:
-        print(f"\nERRO: {e}")
-        sys.exit(1)
\ No newline at end of file
+    compilados = iter(compilados)
+    resultados = [r if r is not None else next(compilados) for r in resultados]
+
+    falhou = False
+    for saida, erro in resultados:
+        sys.stdout.write(saida)
+        falhou = falhou or erro
+
+    if falhou:
+        sys.exit(1)
@@ -0,0 +1,76 @@
+import re
+from copy import copy
+from functools import partial
+from ply.lex import LexToken
+
+# ==================================================================
+# Lexer por regex mestre (compartilhado pelas fases 1 e 2)
+# ==================================================================
+# As regras (nome, regex) de cada linguagem formam um único regex
+# mestre; o lexer percorre a entrada com finditer (o laço de busca
+# fica no motor de regex, em C) e o grupo nomeado que casou
+# (m.lastgroup) é o tipo do token. Espaços e tabs antes de cada token
+# são consumidos pelo próprio regex ([ \t]*), sem uma volta extra do
+# laço em Python por trecho de espaço.
+#
+# Nomes de regra com papel fixo: NL e COMMENT são descartados, mas
+# contam linhas; ERRO casa qualquer caractere ilegal, que é reportado
+# e descartado. O grupo de números é convertido com int() e o de
+# identificadores passa pela função de classificação da linguagem
+# (palavras reservadas, limite de tamanho), que devolve o tipo.
+# ==================================================================
+
+class LexerRegex:
+    # Mesma interface do lexer do PLY usada pelos parsers: input(),
+    # token(), lineno e clone()
+
+    def __init__(self, regras, identificador, numero, classifica):
+        self.master_re = re.compile('[ \t]*(?:' + '|'.join(f'(?P<{nome}>{padrao})' for nome, padrao in regras) + ')')
+        self.identificador = identificador
+        self.numero = numero
+        self.classifica = classifica
+        self.lineno = 1
+        self.lexdata = ''
+        self._proximo = lambda: None
+
+    def input(self, data):
+        self.lexdata = data
+        # ERRO casa qualquer caractere fora de espaço, então os casamentos
+        # são contíguos e finditer nunca salta texto
+        self._proximo = partial(next, self.master_re.finditer(data), None)
+
+    def clone(self):
+        # Novo lexer sem entrada, com as mesmas regras (o regex já
+        # compilado é compartilhado) e o número da linha atual
+        clone = copy(self)
+        clone.lexdata = ''
+        clone._proximo = lambda: None
+        return clone
+
+    def token(self):
+        proximo = self._proximo
+        identificador = self.identificador
+        while (m := proximo()) is not None:
+            tipo = m.lastgroup
+            grupo = m.lastindex
+            valor = m.group(grupo)
+            if tipo == 'NL' or tipo == 'COMMENT':
+                # Quebras de linha e comentários são descartados, mas contam linhas
+                self.lineno += valor.count('\n')
+                continue
+            if tipo == identificador:
+                tipo = self.classifica(valor, self.lineno)
+            elif tipo == self.numero:
+                valor = int(valor)
+            elif tipo == 'ERRO':
+                # Erro léxico: descarta o caractere e continua
+                print(f"Erro Léxico: caractere ilegal '{valor}' na linha {self.lineno}")
+                continue
+
+            tok = LexToken()
+            tok.type = tipo
+            tok.value = valor
+            tok.lineno = self.lineno
+            tok.lexpos = m.start(grupo)
+            return tok
+        return None
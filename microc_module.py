@@ -0,0 +1,354 @@
+# microc_module: definições de token e gramática para MicroC (int/bool)
+
+from lexer_regex import LexerRegex
+
+reservadas = {
+    'int': 'INT',
+    'bool': 'BOOL',
+    'if': 'IF',
+    'else': 'ELSE',
+    'while': 'WHILE',
+    'read': 'READ',
+    'write': 'WRITE',
+    'true': 'TRUE',
+    'false': 'FALSE',
+    'main': 'MAIN',
+    'return': 'RETURN'
+}
+# Identificadores mais longos que isso não podem ser palavra reservada
+MAIOR_RESERVADA = max(map(len, reservadas))
+
+# tokens básicos + palavras reservadas (serão somados)
+tokens = [
+    'IDENT', 'NUM',
+    'ASSIGN', 'EQ', 'NEQ', 'GE', 'LE', 'GT', 'LT',
+    'PLUS', 'MINUS', 'TIMES', 'DIV',
+    'AND', 'OR', 'NOT',
+    'LPAREN', 'RPAREN', 'LBRACE', 'RBRACE',
+    'SEMI', 'COMMA'
+] + list(reservadas.values())
+
+# ---------------------------
+# Analisador léxico
+# ---------------------------
+# As regras (nome, regex) formam o regex mestre do LexerRegex (ver
+# lexer_regex.py). A ordem das alternativas importa: comentários antes
+# de DIV e operadores de dois caracteres antes dos de um. ERRO casa
+# qualquer caractere ilegal.
+REGRAS_LEXICAS = [
+    # Quebra de linha junto com a indentação que a segue
+    ('NL',      r'\n[ \t\n]*'),
+    # Comentário de bloco na forma "desenrolada": avança por trechos sem
+    # '*' em vez de testar o fechamento a cada caractere ([\s\S]*?)
+    ('COMMENT', r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*'),
+    ('NUM',     r'[0-9]+'),
+    ('IDENT',   r'[A-Za-z_][A-Za-z0-9_]*'),
+    ('EQ',      r'=='),
+    ('NEQ',     r'!='),
+    ('GE',      r'>='),
+    ('LE',      r'<='),
+    ('AND',     r'&&'),
+    ('OR',      r'\|\|'),
+    ('ASSIGN',  r'='),
+    ('GT',      r'>'),
+    ('LT',      r'<'),
+    ('PLUS',    r'\+'),
+    ('MINUS',   r'-'),
+    ('TIMES',   r'\*'),
+    ('DIV',     r'/'),
+    ('NOT',     r'!'),
+    ('LPAREN',  r'\('),
+    ('RPAREN',  r'\)'),
+    ('LBRACE',  r'\{'),
+    ('RBRACE',  r'\}'),
+    ('SEMI',    r';'),
+    ('COMMA',   r','),
+    ('ERRO',    r'[^ \t\n]'),
+]
+
+def classifica_identificador(valor, lineno):
+    # Palavras reservadas são classificadas primeiro e nunca passam pela
+    # verificação de comprimento; nomes mais longos que a maior delas
+    # nem consultam o dicionário
+    n = len(valor)
+    if n <= MAIOR_RESERVADA:
+        return reservadas.get(valor, 'IDENT')
+    if n > 20:
+        # Reporta erro léxico para identificadores maiores que 20 caracteres
+        print(f"Erro Léxico: identificador '{valor}' maior que 20 caracteres na linha {lineno}")
+    return 'IDENT'
+
+def cria_lexer():
+    return LexerRegex(REGRAS_LEXICAS, 'IDENT', 'NUM', classifica_identificador)
+
+# Precedência (operadores lógicos, relacionais, aritméticos, unário)
+precedence = (
+    ('left', 'OR'),
+    ('left', 'AND'),
+    ('left', 'EQ', 'NEQ', 'GT', 'LT', 'GE', 'LE'),
+    ('left', 'PLUS', 'MINUS'),
+    ('left', 'TIMES', 'DIV'),
+    ('right', 'NOT'),
+    ('right', 'UMINUS')
+)
+
+# ---------------------------
+# Nós da árvore sintática
+# ---------------------------
+# Uma classe com __slots__ por tipo de nó: layout fixo, sem __dict__
+# por instância e acesso por atributo (node.lhs) em vez de índice.
+# __match_args__ permite desestruturar os nós com match/case.
+
+class Node:
+    __slots__ = ()
+
+    def __repr__(self):
+        # Mesmo texto do repr recursivo, montado com uma pilha explícita:
+        # somas com centenas de termos ou ifs aninhados geram árvores mais
+        # profundas que o limite de recursão do Python. Itens str da pilha
+        # já são texto pronto; nós e listas ainda serão expandidos.
+        partes = []
+        pilha = [self]
+        while pilha:
+            item = pilha.pop()
+            if isinstance(item, Node):
+                seq = [f"{type(item).__name__}("]
+                filhos = [getattr(item, nome) for nome in item.__slots__]
+                fecha = ")"
+            elif type(item) is list:
+                seq = ["["]
+                filhos = item
+                fecha = "]"
+            else:
+                partes.append(item)
+                continue
+            for i, filho in enumerate(filhos):
+                if i:
+                    seq.append(", ")
+                seq.append(filho if isinstance(filho, (Node, list)) else repr(filho))
+            seq.append(fecha)
+            pilha.extend(reversed(seq))
+        return ''.join(partes)
+
+class Program(Node):
+    __slots__ = ('tipo', 'body')
+    __match_args__ = __slots__
+    def __init__(self, tipo, body):
+        self.tipo = tipo
+        self.body = body
+
+class Compound(Node):
+    __slots__ = ('stmts',)
+    __match_args__ = __slots__
+    def __init__(self, stmts):
+        self.stmts = stmts
+
+class Decl(Node):
+    __slots__ = ('ids',)
+    __match_args__ = __slots__
+    def __init__(self, ids):
+        self.ids = ids
+
+class EmptyStmt(Node):
+    __slots__ = ()
+    __match_args__ = __slots__
+
+class Assign(Node):
+    __slots__ = ('name', 'expr')
+    __match_args__ = __slots__
+    def __init__(self, name, expr):
+        self.name = name
+        self.expr = expr
+
+class If(Node):
+    __slots__ = ('cond', 'then', 'els')
+    __match_args__ = __slots__
+    def __init__(self, cond, then, els):
+        self.cond = cond
+        self.then = then
+        self.els = els
+
+class While(Node):
+    __slots__ = ('cond', 'body')
+    __match_args__ = __slots__
+    def __init__(self, cond, body):
+        self.cond = cond
+        self.body = body
+
+class Read(Node):
+    __slots__ = ('ids',)
+    __match_args__ = __slots__
+    def __init__(self, ids):
+        self.ids = ids
+
+class Write(Node):
+    __slots__ = ('exprs',)
+    __match_args__ = __slots__
+    def __init__(self, exprs):
+        self.exprs = exprs
+
+class BinOp(Node):
+    __slots__ = ('op', 'lhs', 'rhs')
+    __match_args__ = __slots__
+    def __init__(self, op, lhs, rhs):
+        self.op = op
+        self.lhs = lhs
+        self.rhs = rhs
+
+class Unary(Node):
+    __slots__ = ('op', 'operand')
+    __match_args__ = __slots__
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+class Value(Node):
+    __slots__ = ('value',)
+    __match_args__ = __slots__
+    def __init__(self, value):
+        self.value = value
+
+# ---------------------------
+# Regras da gramática (MicroC)
+# ---------------------------
+
+# programa obrigatório: tipo main() { ... }
+def p_program(p):
+    'program : INT MAIN LPAREN RPAREN compound_stmt'
+    p[0] = Program(p[1], p[5])
+
+# bloco composto: { lista_comandos }
+def p_compound_stmt(p):
+    'compound_stmt : LBRACE statement_list RBRACE'
+    p[0] = Compound(p[2])
+
+# lista de comandos (pode ser vazia)
+def p_statement_list(p):
+    '''statement_list : statement_list_nonempty
+                      | empty'''
+    p[0] = p[1]
+
+def p_statement_list_nonempty(p):
+    '''statement_list_nonempty : statement
+                               | statement_list_nonempty statement'''
+    # Recursão à esquerda: cada redução apenas anexa ao fim da lista
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[2])
+        p[0] = p[1]
+
+def p_empty(p):
+    'empty :'
+    p[0] = []
+
+# declaração de variáveis: int x, y;
+def p_declaration_stmt(p):
+    'declaration_stmt : INT id_list SEMI'
+    p[0] = Decl(p[2])
+
+def p_id_list(p):
+    '''id_list : IDENT
+               | id_list COMMA IDENT'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
+
+# statement: pode ser atribuição, if, while, read, write, compound, declaration
+def p_statement(p):
+    '''statement : assignment
+                 | if_stmt
+                 | while_stmt
+                 | read_stmt
+                 | write_stmt
+                 | compound_stmt
+                 | declaration_stmt'''
+    p[0] = p[1]
+
+# ponto-e-vírgula isolado
+def p_statement_empty(p):
+    'statement : SEMI'
+    p[0] = EmptyStmt()
+
+# assignment: x = expr;
+def p_assignment(p):
+    'assignment : IDENT ASSIGN expression SEMI'
+    p[0] = Assign(p[1], p[3])
+
+# if (cond) stmt [ else stmt ]
+def p_if_stmt(p):
+    '''if_stmt : IF LPAREN expression RPAREN statement
+               | IF LPAREN expression RPAREN statement ELSE statement'''
+    p[0] = If(p[3], p[5], p[7] if len(p) == 8 else None)
+
+# while (cond) stmt
+def p_while_stmt(p):
+    'while_stmt : WHILE LPAREN expression RPAREN statement'
+    p[0] = While(p[3], p[5])
+
+# read(x, y);
+def p_read_stmt(p):
+    'read_stmt : READ LPAREN id_list RPAREN SEMI'
+    p[0] = Read(p[3])
+
+# write(expr, ...);
+def p_write_stmt(p):
+    'write_stmt : WRITE LPAREN expr_list RPAREN SEMI'
+    p[0] = Write(p[3])
+
+def p_expr_list(p):
+    '''expr_list : expression
+                 | expr_list COMMA expression'''
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
+
+# expressões (binárias, unárias, parênteses, identificador, número, true/false)
+def p_expression_binop(p):
+    '''expression : expression PLUS expression
+                  | expression MINUS expression
+                  | expression TIMES expression
+                  | expression DIV expression
+                  | expression EQ expression
+                  | expression NEQ expression
+                  | expression GT expression
+                  | expression LT expression
+                  | expression GE expression
+                  | expression LE expression
+                  | expression AND expression
+                  | expression OR expression'''
+    p[0] = BinOp(p[2], p[1], p[3])
+
+def p_expression_unop(p):
+    '''expression : NOT expression
+                  | MINUS expression %prec UMINUS'''
+    if p[1] == '-':
+        p[0] = Unary("neg", p[2])
+    else:
+        p[0] = Unary(p[1], p[2])
+
+def p_expression_group(p):
+    'expression : LPAREN expression RPAREN'
+    p[0] = p[2]
+
+def p_expression_value(p):
+    '''expression : IDENT
+                  | NUM
+                  | TRUE
+                  | FALSE'''
+    p[0] = Value(p[1])
+
+# erro sintático
+def p_error(p):
+    if p:
+        try:
+            lineno = p.lineno
+        except AttributeError:
+            lineno = '?'
+        print(f"Erro Sintático: Token inesperado '{p.value}' na linha {lineno}")
+    else:
+        print("Erro Sintático: Fim de arquivo inesperado")
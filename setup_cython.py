@@ -0,0 +1,43 @@
+import os
+import ply
+from setuptools import setup
+from Cython.Build import cythonize
+
+# ==================================================================
+# Compilação opcional do PLY com Cython
+# ==================================================================
+# Os dois lexers do projeto são próprios (não usam ply.lex); o laço
+# quente restante dentro do PLY é parser.parse(), em ply/yacc.py.
+# Compilar yacc.py com Cython, sem alterar o código, acelera esse laço.
+#
+# Uso:
+#     pip install cython
+#     python setup_cython.py build
+#     PYTHONPATH=build/ply-cython python fase2_pascalite_mepa.py
+#
+# Nada é gravado no pacote ply instalado: o .c gerado fica em
+# build/cython-src e o build/ply-cython recebe uma cópia do pacote ply
+# com yacc compilado (.so/.pyd). Sem o PYTHONPATH, o PLY instalado
+# (Python puro) continua sendo usado. Para gerar um wheel instalável
+# num ambiente virtual: python setup_cython.py bdist_wheel.
+#
+# Observação: get_caller_module_dict() usa sys._getframe(), que não
+# enxerga os frames de funções compiladas. Não afeta este projeto
+# porque yacc.yacc() sempre recebe module=... aqui.
+# ==================================================================
+
+DIRETORIO_PLY = os.path.dirname(ply.__file__)
+DIRETORIO_BUILD = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'build')
+
+setup(
+    name='ply-cython',
+    version=ply.__version__,
+    packages=['ply'],
+    package_dir={'ply': DIRETORIO_PLY},
+    ext_modules=cythonize(
+        [os.path.join(DIRETORIO_PLY, 'yacc.py')],
+        build_dir=os.path.join(DIRETORIO_BUILD, 'cython-src'),
+        compiler_directives={'language_level': 3, 'binding': True},
+    ),
+    options={'build': {'build_lib': os.path.join(DIRETORIO_BUILD, 'ply-cython')}},
+)